@@ -19,11 +19,11 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.const import Platform
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from datetime import timedelta
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers import device_registry as dr
 
 from .const import (
     DOMAIN,
+    DEFAULT_NAME,
+    device_slug,
     CONF_POWER_SENSOR,
     CONF_COST_SENSOR,
     CONF_START_WATTS,
@@ -47,31 +47,40 @@ from .coordinator import SmartDumbApplianceCoordinator
 # Set up logging for this module
 _LOGGER = logging.getLogger(__name__)
 
-# Debug log to verify module loading
-_LOGGER.info("Smart Dumb Appliance integration is being loaded")
-
 # Define the platforms that this integration supports
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Smart Dumb Appliance integration."""
-    _LOGGER.info("Setting up Smart Dumb Appliance integration")
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Smart Dumb Appliance from a config entry."""
-    # Get the configuration data
+    # Get the configuration data (read-only, no copy needed for lookups)
     config = entry.data
-    
+
     # Handle migration from old debounce to new start/end debounce
     if CONF_DEBOUNCE in config and CONF_START_DEBOUNCE not in config:
         _LOGGER.info("Migrating from old debounce configuration to new start/end debounce")
         old_debounce = config[CONF_DEBOUNCE]
-        config[CONF_START_DEBOUNCE] = old_debounce
-        config[CONF_END_DEBOUNCE] = old_debounce
-        # Update the config entry
-        hass.config_entries.async_update_entry(entry, data=config)
+        # Only build a mutable copy when we actually need to change it
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **config,
+                CONF_START_DEBOUNCE: old_debounce,
+                CONF_END_DEBOUNCE: old_debounce,
+            },
+        )
     
+    # Entries created before setup keyed them by name have no unique id; backfill
+    # it so the duplicate-name check covers them too, unless another entry already
+    # holds the same name
+    if entry.unique_id is None:
+        unique_id = device_slug(config.get(CONF_DEVICE_NAME, DEFAULT_NAME))
+        if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id) is None:
+            hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+
     # Create the coordinator with the ConfigEntry object
     coordinator = SmartDumbApplianceCoordinator(hass, entry)
     
@@ -82,6 +91,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Set up the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Subscribe to the power sensor in the background; the task is tied to the
+    # entry so it is cancelled if the entry unloads before setup finishes
+    entry.async_create_background_task(
+        hass, coordinator.async_setup(), f"{DOMAIN}_{entry.entry_id}_setup"
+    )
     
     return True
 
@@ -103,38 +118,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
         
         if unload_ok:
-            # Get the entity registry
-            entity_registry = er.async_get(hass)
-            device_registry = dr.async_get(hass)
-            
-            # Get the device
-            device = device_registry.async_get_device(
-                identifiers={(DOMAIN, entry.entry_id)}
-            )
-            
-            if device:
-                # Update the device name
-                device_registry.async_update_device(
-                    device.id,
-                    name=entry.data.get(CONF_DEVICE_NAME, "Smart Dumb Appliance")
-                )
-                
-                # Update all entities associated with this device
-                for entity in entity_registry.entities.values():
-                    if entity.device_id == device.id:
-                        # Update the entity name to match the new device name
-                        new_name = f"{entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')} {entity.original_name.split(' ', 1)[1]}"
-                        entity_registry.async_update_entity(
-                            entity.entity_id,
-                            name=new_name
-                        )
-                        _LOGGER.debug("Updated entity name: %s -> %s", entity.original_name, new_name)
-            
             # Remove the coordinator from hass.data
             hass.data[DOMAIN].pop(entry.entry_id)
             
         return unload_ok
         
-    except Exception as e:
-        _LOGGER.error("Error unloading entry: %s", str(e))
+    except KeyError as e:
+        # A missing domain store
+        _LOGGER.error("Error unloading entry: %s", e)
         return False
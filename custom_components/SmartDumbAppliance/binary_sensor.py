@@ -21,6 +21,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    DOMAIN,
     CONF_POWER_SENSOR,
     CONF_START_WATTS,
     CONF_STOP_WATTS,
@@ -30,7 +31,6 @@ from .const import (
     DEFAULT_STOP_WATTS,
     DEFAULT_START_DEBOUNCE,
     DEFAULT_END_DEBOUNCE,
-    CONF_DEVICE_NAME,
     ATTR_POWER_USAGE,
     ATTR_LAST_UPDATE,
     ATTR_START_TIME,
@@ -47,12 +47,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Smart Dumb Appliance binary sensor from a config entry."""
-    # Get the configuration data
-    config = config_entry.data
-    device_name = config[CONF_DEVICE_NAME]
-
     # Get the coordinator from hass.data
-    coordinator = hass.data["smart_dumb_appliance"][config_entry.entry_id]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     # Create and add the binary sensor
     async_add_entities([SmartDumbApplianceBinarySensor(hass, config_entry, coordinator)])
@@ -70,6 +66,13 @@ class SmartDumbApplianceBinarySensor(BinarySensorEntity):
     - Power sensor configuration
     """
 
+    # Fixed entity descriptors shared by every instance; updates are pushed by
+    # the coordinator, so Home Assistant must not poll
+    _attr_device_class = BinarySensorDeviceClass.POWER
+    _attr_has_entity_name = True
+    _attr_translation_key = "power_state"
+    _attr_should_poll = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -88,15 +91,12 @@ class SmartDumbApplianceBinarySensor(BinarySensorEntity):
         self.config_entry = config_entry
         self.coordinator = coordinator
         
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
+        # Get device name from the coordinator (resolved once per entry)
+        device_name = coordinator.device_name
         
         # Set up entity attributes
         self._attr_name = f"{device_name} Power State"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_power_state"
-        self._attr_device_class = BinarySensorDeviceClass.POWER
-        self._attr_has_entity_name = True
-        self._attr_translation_key = "power_state"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_power_state"
         
         # Load configuration
         self._power_sensor = config_entry.data[CONF_POWER_SENSOR]
@@ -138,11 +138,6 @@ class SmartDumbApplianceBinarySensor(BinarySensorEntity):
             self._end_debounce
         )
 
-    @property
-    def should_poll(self) -> bool:
-        """Return False as we use the coordinator for updates."""
-        return False
-
     @property
     def available(self) -> bool:
         """Return True if the coordinator is available."""
@@ -183,7 +178,9 @@ class SmartDumbApplianceBinarySensor(BinarySensorEntity):
             ATTR_USE_COUNT: data.use_count,
         })
 
-        # Log state change if it occurred
+        # Log the update only when debug logging is on, since this runs on every refresh
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
         if old_state != self._attr_is_on:
             _LOGGER.debug(
                 "Binary sensor %s state changed - Old: %s, New: %s, Power: %.1fW (%.3f kW)",
@@ -9,6 +9,7 @@ appliance settings, such as power sensors, cost tracking, and service reminders.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -28,6 +29,7 @@ from homeassistant.helpers.selector import (
 
 from .const import (
     DOMAIN,
+    device_slug,
     CONF_POWER_SENSOR,
     CONF_COST_SENSOR,
     CONF_START_WATTS,
@@ -42,12 +44,77 @@ from .const import (
     DEFAULT_STOP_WATTS,
     DEFAULT_START_DEBOUNCE,
     DEFAULT_END_DEBOUNCE,
+    DEFAULT_SERVICE_REMINDER,
+    DEFAULT_SERVICE_REMINDER_COUNT,
     DEFAULT_SERVICE_REMINDER_MESSAGE,
 )
 
 # Set up logging for this module
 _LOGGER = logging.getLogger(__name__)
 
+# Field descriptions are shared by every form render rather than rebuilt per schema
+_DESC_DEVICE_NAME = {"suffix": "Name shown in Home Assistant"}
+_DESC_POWER_SENSOR = {"suffix": "Sensor that measures power in watts"}
+_DESC_START_WATTS = {
+    "suffix": " watts",
+    "tooltip": "Power threshold that indicates the appliance has started. Must be higher than stop watts."
+}
+_DESC_STOP_WATTS = {
+    "suffix": " watts",
+    "tooltip": "Power threshold that indicates the appliance has stopped. Must be lower than start watts."
+}
+_DESC_COST_SENSOR = {"suffix": "Sensor providing cost per kWh"}
+_DESC_DEBOUNCE = {
+    "suffix": " seconds",
+    "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
+}
+_DESC_SERVICE_REMINDER = {"tooltip": "Enable service reminders after a set number of uses"}
+_DESC_SERVICE_REMINDER_COUNT = {"tooltip": "Number of uses before showing a service reminder"}
+_DESC_SERVICE_REMINDER_MESSAGE = {"tooltip": "Message to show when service is needed"}
+
+# Selectors are plain descriptors, so one instance of each is shared by every schema build
+_POWER_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["sensor"])
+)
+_COST_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["input_number", "number"])
+)
+_WATTS_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=10000,
+        step=0.1,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="W",
+    ),
+)
+_DEBOUNCE_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=300,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="s",
+    ),
+)
+_SERVICE_REMINDER_SELECTOR = BooleanSelector(
+    BooleanSelectorConfig(),
+)
+_SERVICE_REMINDER_COUNT_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=0,
+        max=1000,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+    ),
+)
+_SERVICE_REMINDER_MESSAGE_SELECTOR = TextSelector(
+    TextSelectorConfig(
+        type="text",
+        multiline=True,
+    ),
+)
+
 def validate_watt_thresholds(data: dict[str, Any]) -> dict[str, str]:
     """
     Validate that watt thresholds are in the correct order.
@@ -66,6 +133,81 @@ def validate_watt_thresholds(data: dict[str, Any]) -> dict[str, str]:
     
     return errors
 
+def _build_schema(defaults: Mapping[str, Any], include_name: bool = True) -> vol.Schema:
+    """
+    Build the appliance settings schema in a single construction.
+    
+    Args:
+        defaults: Values to pre-fill the form with, falling back to the
+            integration defaults for any missing setting
+        include_name: Whether to ask for the device name; it is fixed after setup
+            because the entity unique ids are derived from it
+        
+    Returns:
+        vol.Schema: The schema for the appliance settings form
+    """
+    fields = {}
+    if include_name:
+        fields[vol.Required(
+            CONF_DEVICE_NAME,
+            default=defaults.get(CONF_DEVICE_NAME, vol.UNDEFINED),
+            description=_DESC_DEVICE_NAME
+        )] = str
+
+    return vol.Schema({
+        **fields,
+        vol.Required(
+            CONF_POWER_SENSOR,
+            default=defaults.get(CONF_POWER_SENSOR, vol.UNDEFINED),
+            description=_DESC_POWER_SENSOR
+        ): _POWER_SENSOR_SELECTOR,
+        vol.Required(
+            CONF_START_WATTS,
+            default=defaults.get(CONF_START_WATTS, DEFAULT_START_WATTS),
+            description=_DESC_START_WATTS
+        ): _WATTS_SELECTOR,
+        vol.Required(
+            CONF_STOP_WATTS,
+            default=defaults.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS),
+            description=_DESC_STOP_WATTS
+        ): _WATTS_SELECTOR,
+        vol.Optional(
+            CONF_COST_SENSOR,
+            # A stored None means "no cost sensor"; leave the field empty instead of
+            # pre-filling a value the entity selector would reject
+            default=defaults.get(CONF_COST_SENSOR) or vol.UNDEFINED,
+            description=_DESC_COST_SENSOR
+        ): _COST_SENSOR_SELECTOR,
+        vol.Optional(
+            CONF_START_DEBOUNCE,
+            default=defaults.get(CONF_START_DEBOUNCE, DEFAULT_START_DEBOUNCE),
+            description=_DESC_DEBOUNCE
+        ): _DEBOUNCE_SELECTOR,
+        vol.Optional(
+            CONF_END_DEBOUNCE,
+            default=defaults.get(CONF_END_DEBOUNCE, DEFAULT_END_DEBOUNCE),
+            description=_DESC_DEBOUNCE
+        ): _DEBOUNCE_SELECTOR,
+        vol.Optional(
+            CONF_SERVICE_REMINDER,
+            default=defaults.get(CONF_SERVICE_REMINDER, DEFAULT_SERVICE_REMINDER),
+            description=_DESC_SERVICE_REMINDER
+        ): _SERVICE_REMINDER_SELECTOR,
+        vol.Optional(
+            CONF_SERVICE_REMINDER_COUNT,
+            default=defaults.get(CONF_SERVICE_REMINDER_COUNT, DEFAULT_SERVICE_REMINDER_COUNT),
+            description=_DESC_SERVICE_REMINDER_COUNT
+        ): _SERVICE_REMINDER_COUNT_SELECTOR,
+        vol.Optional(
+            CONF_SERVICE_REMINDER_MESSAGE,
+            default=defaults.get(CONF_SERVICE_REMINDER_MESSAGE, DEFAULT_SERVICE_REMINDER_MESSAGE),
+            description=_DESC_SERVICE_REMINDER_MESSAGE
+        ): _SERVICE_REMINDER_MESSAGE_SELECTOR,
+    })
+
+# The initial setup form never changes, so build it once at import
+USER_SCHEMA = _build_schema({CONF_DEVICE_NAME: "My Appliance"})
+
 class SmartDumbApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """
     Handle the configuration flow for Smart Dumb Appliance.
@@ -81,6 +223,14 @@ class SmartDumbApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the configuration flow."""
         self._errors = {}  # Store any validation errors
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SmartDumbApplianceOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return SmartDumbApplianceOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -96,7 +246,13 @@ class SmartDumbApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         - Debounce time (optional)
         - Service reminder settings (optional)
         """
-        if user_input is not None:
+        if user_input:
+            # Entity unique ids derive from the normalized device name (the same
+            # prefix the coordinator builds), so names that only differ in case or
+            # spacing would collide; key the entry on it and abort on a match
+            await self.async_set_unique_id(device_slug(user_input[CONF_DEVICE_NAME]))
+            self._abort_if_unique_id_configured()
+
             # Validate the input
             self._errors = validate_watt_thresholds(user_input)
             
@@ -107,414 +263,59 @@ class SmartDumbApplianceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input
                 )
 
-        # Create the configuration form
-        schema = vol.Schema({
-            # Required fields
-            vol.Required(
-                CONF_DEVICE_NAME,
-                default="My Appliance",
-                description={"suffix": "Name shown in Home Assistant"}
-            ): str,
-            vol.Required(
-                CONF_POWER_SENSOR,
-                description={"suffix": "Sensor that measures power in watts"}
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["sensor"])
-            ),
-            vol.Required(
-                CONF_START_WATTS,
-                default=DEFAULT_START_WATTS,
-                description={
-                    "suffix": " watts",
-                    "tooltip": "Power threshold that indicates the appliance has started. Must be higher than stop watts."
-                }
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=0,
-                    max=10000,
-                    step=0.1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="W",
-                ),
-            ),
-            vol.Required(
-                CONF_STOP_WATTS,
-                default=DEFAULT_STOP_WATTS,
-                description={
-                    "suffix": " watts",
-                    "tooltip": "Power threshold that indicates the appliance has stopped. Must be lower than start watts."
-                }
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=0,
-                    max=10000,
-                    step=0.1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="W",
-                ),
-            ),
-            
-            # Optional fields with defaults
-            vol.Optional(
-                CONF_COST_SENSOR,
-                description={"suffix": "Sensor providing cost per kWh"}
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["input_number", "number"])
-            ),
-            vol.Optional(
-                CONF_START_DEBOUNCE,
-                default=DEFAULT_START_DEBOUNCE,
-                description={
-                    "suffix": " seconds",
-                    "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                }
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=0,
-                    max=300,
-                    step=1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="s",
-                ),
-            ),
-            vol.Optional(
-                CONF_END_DEBOUNCE,
-                default=DEFAULT_END_DEBOUNCE,
-                description={
-                    "suffix": " seconds",
-                    "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                }
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=0,
-                    max=300,
-                    step=1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="s",
-                ),
-            ),
-            
-            # Service reminder settings
-            vol.Optional(
-                CONF_SERVICE_REMINDER,
-                default=False,
-                description={"tooltip": "Enable service reminders after a set number of uses"}
-            ): BooleanSelector(
-                BooleanSelectorConfig(),
-            ),
-            vol.Optional(
-                CONF_SERVICE_REMINDER_COUNT,
-                default=0,
-                description={"tooltip": "Number of uses before showing a service reminder"}
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=0,
-                    max=1000,
-                    step=1,
-                    mode=NumberSelectorMode.BOX,
-                ),
-            ),
-            vol.Optional(
-                CONF_SERVICE_REMINDER_MESSAGE,
-                default=DEFAULT_SERVICE_REMINDER_MESSAGE,
-                description={"tooltip": "Message to show when service is needed"}
-            ): TextSelector(
-                TextSelectorConfig(
-                    type="text",
-                    multiline=True,
-                ),
-            ),
-        })
-
         # Show the configuration form
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=USER_SCHEMA,
             errors=self._errors,
         )
 
-    async def async_step_reconfigure(
+
+class SmartDumbApplianceOptionsFlowHandler(config_entries.OptionsFlow):
+    """
+    Handle the options flow for Smart Dumb Appliance.
+    
+    This is the single place to adjust the settings of an existing appliance,
+    from its "Configure" button. The device name is left out because the entity
+    unique ids are derived from it.
+    """
+
+    async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """
-        Handle reconfiguration of an existing entry.
+        Manage the appliance settings.
         
-        This method allows users to modify the settings of an existing
-        appliance configuration.
+        Shows the same settings as the initial setup except the device name,
+        pre-filled with the current configuration, and reloads the entry when
+        they are saved.
         """
-        # Get the current configuration from the context
-        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-        if not entry:
-            _LOGGER.error("Failed to find entry for reconfiguration")
-            return self.async_abort(reason="no_entry")
-            
-        # Try to get current values from the energy usage sensor
-        current_config = entry.data
-        energy_sensor_id = f"sensor.{entry.data[CONF_DEVICE_NAME].lower().replace(' ', '_')}_energy_usage"
-        energy_sensor = self.hass.states.get(energy_sensor_id)
-        
-        if energy_sensor and energy_sensor.attributes:
-            # Use values from sensor attributes if available
-            current_config = {
-                **current_config,  # Keep any values not in attributes
-                CONF_START_WATTS: energy_sensor.attributes.get("start_watts", current_config.get(CONF_START_WATTS, DEFAULT_START_WATTS)),
-                CONF_STOP_WATTS: energy_sensor.attributes.get("stop_watts", current_config.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS)),
-                CONF_START_DEBOUNCE: energy_sensor.attributes.get("start_debounce", current_config.get(CONF_START_DEBOUNCE, DEFAULT_START_DEBOUNCE)),
-                CONF_END_DEBOUNCE: energy_sensor.attributes.get("end_debounce", current_config.get(CONF_END_DEBOUNCE, DEFAULT_END_DEBOUNCE)),
-                CONF_POWER_SENSOR: energy_sensor.attributes.get("power_sensor", current_config.get(CONF_POWER_SENSOR)),
-                CONF_COST_SENSOR: energy_sensor.attributes.get("cost_sensor", current_config.get(CONF_COST_SENSOR)),
-                CONF_SERVICE_REMINDER: energy_sensor.attributes.get("service_reminder_enabled", current_config.get(CONF_SERVICE_REMINDER, False)),
-                CONF_SERVICE_REMINDER_COUNT: energy_sensor.attributes.get("service_reminder_count", current_config.get(CONF_SERVICE_REMINDER_COUNT, 0)),
-                CONF_SERVICE_REMINDER_MESSAGE: energy_sensor.attributes.get("service_reminder_message", current_config.get(CONF_SERVICE_REMINDER_MESSAGE, DEFAULT_SERVICE_REMINDER_MESSAGE)),
-            }
+        errors = {}
 
-        # If user input is provided, update the configuration
-        if user_input is not None:
+        if user_input:
             # Validate the watt thresholds
-            threshold_errors = validate_watt_thresholds(user_input)
-            if threshold_errors:
-                return self.async_show_form(
-                    step_id="reconfigure",
-                    data_schema=vol.Schema({
-                        vol.Required(
-                            CONF_DEVICE_NAME,
-                            default=user_input.get(CONF_DEVICE_NAME, current_config.get(CONF_DEVICE_NAME)),
-                            description={"suffix": "Name shown in Home Assistant"}
-                        ): str,
-                        vol.Required(
-                            CONF_POWER_SENSOR,
-                            default=user_input.get(CONF_POWER_SENSOR, current_config.get(CONF_POWER_SENSOR)),
-                            description={"suffix": "Sensor that measures power in watts"}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=["sensor"])
-                        ),
-                        vol.Required(
-                            CONF_START_WATTS,
-                            default=user_input.get(CONF_START_WATTS, current_config.get(CONF_START_WATTS, DEFAULT_START_WATTS)),
-                            description={
-                                "suffix": " watts",
-                                "tooltip": "Power threshold that indicates the appliance has started. Must be higher than stop watts."
-                            }
-                        ): NumberSelector(
-                            NumberSelectorConfig(
-                                min=0,
-                                max=10000,
-                                step=0.1,
-                                mode=NumberSelectorMode.BOX,
-                                unit_of_measurement="W",
-                            ),
-                        ),
-                        vol.Required(
-                            CONF_STOP_WATTS,
-                            default=user_input.get(CONF_STOP_WATTS, current_config.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS)),
-                            description={
-                                "suffix": " watts",
-                                "tooltip": "Power threshold that indicates the appliance has stopped. Must be lower than start watts."
-                            }
-                        ): NumberSelector(
-                            NumberSelectorConfig(
-                                min=0,
-                                max=10000,
-                                step=0.1,
-                                mode=NumberSelectorMode.BOX,
-                                unit_of_measurement="W",
-                            ),
-                        ),
-                        vol.Optional(
-                            CONF_COST_SENSOR,
-                            default=user_input.get(CONF_COST_SENSOR, current_config.get(CONF_COST_SENSOR)),
-                            description={"suffix": "Sensor providing cost per kWh"}
-                        ): selector.EntitySelector(
-                            selector.EntitySelectorConfig(domain=["input_number", "number"])
-                        ),
-                        vol.Optional(
-                            CONF_START_DEBOUNCE,
-                            default=user_input.get(CONF_START_DEBOUNCE, current_config.get(CONF_START_DEBOUNCE, DEFAULT_START_DEBOUNCE)),
-                            description={
-                                "suffix": " seconds",
-                                "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                            }
-                        ): NumberSelector(
-                            NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                mode=NumberSelectorMode.BOX,
-                                unit_of_measurement="s",
-                            ),
-                        ),
-                        vol.Optional(
-                            CONF_END_DEBOUNCE,
-                            default=user_input.get(CONF_END_DEBOUNCE, current_config.get(CONF_END_DEBOUNCE, DEFAULT_END_DEBOUNCE)),
-                            description={
-                                "suffix": " seconds",
-                                "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                            }
-                        ): NumberSelector(
-                            NumberSelectorConfig(
-                                min=0,
-                                max=300,
-                                step=1,
-                                mode=NumberSelectorMode.BOX,
-                                unit_of_measurement="s",
-                            ),
-                        ),
-                        vol.Optional(
-                            CONF_SERVICE_REMINDER,
-                            default=user_input.get(CONF_SERVICE_REMINDER, current_config.get(CONF_SERVICE_REMINDER, False)),
-                            description={"tooltip": "Enable service reminders after a set number of uses"}
-                        ): BooleanSelector(
-                            BooleanSelectorConfig(),
-                        ),
-                        vol.Optional(
-                            CONF_SERVICE_REMINDER_COUNT,
-                            default=user_input.get(CONF_SERVICE_REMINDER_COUNT, current_config.get(CONF_SERVICE_REMINDER_COUNT, 0)),
-                            description={"tooltip": "Number of uses before showing a service reminder"}
-                        ): NumberSelector(
-                            NumberSelectorConfig(
-                                min=0,
-                                max=1000,
-                                step=1,
-                                mode=NumberSelectorMode.BOX,
-                            ),
-                        ),
-                        vol.Optional(
-                            CONF_SERVICE_REMINDER_MESSAGE,
-                            default=user_input.get(CONF_SERVICE_REMINDER_MESSAGE, current_config.get(CONF_SERVICE_REMINDER_MESSAGE, DEFAULT_SERVICE_REMINDER_MESSAGE)),
-                            description={"tooltip": "Message to show when service is needed"}
-                        ): TextSelector(
-                            TextSelectorConfig(
-                                type="text",
-                                multiline=True,
-                            ),
-                        ),
-                    }),
-                    errors=threshold_errors,
-                )
+            errors = validate_watt_thresholds(user_input)
 
-            # Update the configuration entry
-            return self.async_update_reload_and_abort(
-                entry,
-                data=user_input,
-                reason="reconfigure_successful"
-            )
+            if not errors:
+                # Settings live in the entry data, so store them there and reload;
+                # an unchanged save leaves the running coordinator and its listeners alone
+                if self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={
+                        **user_input,
+                        CONF_DEVICE_NAME: self.config_entry.data[CONF_DEVICE_NAME],
+                    },
+                ):
+                    self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+                return self.async_create_entry(data={})
+
+        data_schema = _build_schema(self.config_entry.data, include_name=False)
+        if errors:
+            # Keep what the user entered when re-showing the form after an error
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
 
-        # Show the reconfiguration form with current values
         return self.async_show_form(
-            step_id="reconfigure",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_DEVICE_NAME,
-                    default=current_config.get(CONF_DEVICE_NAME),
-                    description={"suffix": "Name shown in Home Assistant"}
-                ): str,
-                vol.Required(
-                    CONF_POWER_SENSOR,
-                    default=current_config.get(CONF_POWER_SENSOR),
-                    description={"suffix": "Sensor that measures power in watts"}
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["sensor"])
-                ),
-                vol.Required(
-                    CONF_START_WATTS,
-                    default=current_config.get(CONF_START_WATTS, DEFAULT_START_WATTS),
-                    description={
-                        "suffix": " watts",
-                        "tooltip": "Power threshold that indicates the appliance has started. Must be higher than stop watts."
-                    }
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=10000,
-                        step=0.1,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="W",
-                    ),
-                ),
-                vol.Required(
-                    CONF_STOP_WATTS,
-                    default=current_config.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS),
-                    description={
-                        "suffix": " watts",
-                        "tooltip": "Power threshold that indicates the appliance has stopped. Must be lower than start watts."
-                    }
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=10000,
-                        step=0.1,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="W",
-                    ),
-                ),
-                vol.Optional(
-                    CONF_COST_SENSOR,
-                    default=current_config.get(CONF_COST_SENSOR),
-                    description={"suffix": "Sensor providing cost per kWh"}
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["input_number", "number"])
-                ),
-                vol.Optional(
-                    CONF_START_DEBOUNCE,
-                    default=current_config.get(CONF_START_DEBOUNCE, DEFAULT_START_DEBOUNCE),
-                    description={
-                        "suffix": " seconds",
-                        "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                    }
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=300,
-                        step=1,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="s",
-                    ),
-                ),
-                vol.Optional(
-                    CONF_END_DEBOUNCE,
-                    default=current_config.get(CONF_END_DEBOUNCE, DEFAULT_END_DEBOUNCE),
-                    description={
-                        "suffix": " seconds",
-                        "tooltip": "Time to wait before confirming state changes. Prevents rapid on/off cycling."
-                    }
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=300,
-                        step=1,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="s",
-                    ),
-                ),
-                vol.Optional(
-                    CONF_SERVICE_REMINDER,
-                    default=current_config.get(CONF_SERVICE_REMINDER, False),
-                    description={"tooltip": "Enable service reminders after a set number of uses"}
-                ): BooleanSelector(
-                    BooleanSelectorConfig(),
-                ),
-                vol.Optional(
-                    CONF_SERVICE_REMINDER_COUNT,
-                    default=current_config.get(CONF_SERVICE_REMINDER_COUNT, 0),
-                    description={"tooltip": "Number of uses before showing a service reminder"}
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=1000,
-                        step=1,
-                        mode=NumberSelectorMode.BOX,
-                    ),
-                ),
-                vol.Optional(
-                    CONF_SERVICE_REMINDER_MESSAGE,
-                    default=current_config.get(CONF_SERVICE_REMINDER_MESSAGE, DEFAULT_SERVICE_REMINDER_MESSAGE),
-                    description={"tooltip": "Message to show when service is needed"}
-                ): TextSelector(
-                    TextSelectorConfig(
-                        type="text",
-                        multiline=True,
-                    ),
-                ),
-            }),
-            errors=self._errors,
+            step_id="init",
+            data_schema=data_schema,
+            errors=errors,
         )
@@ -1,18 +1,22 @@
 """Data coordinator for Smart Dumb Appliance."""
-from dataclasses import dataclass
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Optional, Callable
+from typing import Any, NamedTuple, Optional
 import asyncio
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
+    DEFAULT_NAME,
+    device_slug,
     CONF_POWER_SENSOR,
     CONF_COST_SENSOR,
     CONF_START_WATTS,
@@ -24,18 +28,80 @@ from .const import (
     CONF_SERVICE_REMINDER_COUNT,
     CONF_DEBOUNCE,
     DEFAULT_DEBOUNCE,
+    DEFAULT_SERVICE_REMINDER,
+    DEFAULT_SERVICE_REMINDER_COUNT,
     CONF_START_DEBOUNCE,
     CONF_END_DEBOUNCE,
+    CONF_DEVICE_NAME,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
-class ApplianceData:
-    """Class to hold appliance data."""
-    last_update: datetime
+# Bound once so the update path skips the module attribute lookups
+_utcnow = dt_util.utcnow
+
+# Watt-seconds to kilowatt-hours with the trapezoid's halving folded in
+_WATT_SECONDS_TO_KWH_HALF = 1.0 / (2.0 * 1000.0 * 3600.0)
+
+# Fallback poll intervals; power sensor events drive updates in between. While a
+# cycle runs the poll also ticks the duration and notices a silent sensor, so it
+# stays short; an idle appliance only needs the occasional check
+_RUNNING_POLL_INTERVAL = timedelta(seconds=5)
+_IDLE_POLL_INTERVAL = timedelta(seconds=60)
+
+# Slack after a debounce deadline so the confirming refresh never runs early
+_DEBOUNCE_MARGIN_SECONDS = 0.5
+
+# Window in which requested refreshes (debounce confirmations) collapse into one
+_REFRESH_COALESCE_SECONDS = 1.0
+
+# Non-numeric states sensors report while offline or reloading; rejected without a float parse
+_UNAVAILABLE_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE, "none", ""})
+
+
+def _parse_float(value: str) -> float | None:
+    """
+    Parse a numeric sensor state.
+    
+    Args:
+        value: The raw state string
+        
+    Returns:
+        float | None: The parsed value, or None if the state is not numeric
+    """
+    # Offline states are common during reloads, so reject them before parsing
+    if value in _UNAVAILABLE_STATES:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def _kahan_add(total: float, compensation: float, value: float) -> tuple[float, float]:
+    """
+    Add a value to a running total using Kahan compensated summation.
+    
+    Args:
+        total: The running total
+        compensation: Low-order bits lost by previous additions
+        value: The value to add
+        
+    Returns:
+        tuple[float, float]: The new total and compensation
+    """
+    adjusted = value - compensation
+    new_total = total + adjusted
+    return new_total, (new_total - total) - adjusted
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration in seconds as H:MM:SS."""
+    return str(timedelta(seconds=seconds))
+
+
+class ApplianceData(NamedTuple):
+    """Class to hold appliance data (an immutable snapshot shared by all listeners)."""
+    last_update: datetime  # When a reading last changed the snapshot (held while idle)
     power_state: float  # Current power in watts
-    power_kw: float    # Current power in kilowatts
     is_running: bool
     start_time: datetime | None
     end_time: datetime | None
@@ -47,16 +113,20 @@ class ApplianceData:
     previous_cycle_cost: float  # Cost of previous cycle
     total_cost: float   # Total cost
     last_power: float   # Previous power reading for trapezoidal integration
-    last_power_time: datetime | None  # Timestamp of previous power reading
-    cycle_duration: timedelta | None  # Duration of current or last completed cycle
-    last_cycle_duration: timedelta | None  # Duration of previous cycle
-    total_duration: timedelta  # Total duration of all cycles
+    last_power_time: float | None  # Timestamp of previous power reading (epoch seconds)
+    last_cycle_seconds: float | None  # Duration of previous cycle (seconds)
+    total_seconds: float  # Total duration of all cycles (seconds)
     service_status: str  # Current service status (ok/needs_service/disabled)
     service_reminder_enabled: bool  # Whether service reminders are enabled
     service_reminder_message: str  # Message to display when service is needed
     service_reminder_count: int  # Number of cycles until service is needed
     remaining_cycles: int  # Number of cycles remaining until service is needed
 
+    @property
+    def power_kw(self) -> float:
+        """Return the current power in kilowatts, computed only when read."""
+        return self.power_state * 0.001
+
     @property
     def formatted_last_update(self) -> str | None:
         """Return formatted last_update."""
@@ -72,56 +142,100 @@ class ApplianceData:
         """Return formatted end_time."""
         return self.end_time.isoformat() if self.end_time else None
 
+    @property
+    def cycle_duration(self) -> timedelta | None:
+        """Return the duration of the current cycle, computed only when read."""
+        if self.is_running and self.start_time:
+            return self.last_update - self.start_time
+        return None
+
     @property
     def formatted_cycle_duration(self) -> str:
         """Return formatted cycle_duration."""
-        return str(self.cycle_duration) if self.cycle_duration else "0:00:00"
+        duration = self.cycle_duration
+        return _format_seconds(duration.total_seconds()) if duration else "0:00:00"
+
+    @property
+    def last_cycle_duration(self) -> timedelta | None:
+        """Return the duration of the previous cycle, converted only when read."""
+        if self.last_cycle_seconds is None:
+            return None
+        return timedelta(seconds=self.last_cycle_seconds)
+
+    @property
+    def total_duration(self) -> timedelta:
+        """Return the total duration of all cycles, converted only when read."""
+        return timedelta(seconds=self.total_seconds)
 
     @property
     def formatted_last_cycle_duration(self) -> str:
         """Return formatted last_cycle_duration."""
-        return str(self.last_cycle_duration) if self.last_cycle_duration else "0:00:00"
+        return _format_seconds(self.last_cycle_seconds) if self.last_cycle_seconds else "0:00:00"
 
     @property
     def formatted_total_duration(self) -> str:
         """Return formatted total_duration."""
-        return str(self.total_duration) if self.total_duration else "0:00:00"
+        return _format_seconds(self.total_seconds) if self.total_seconds else "0:00:00"
 
 class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
     """Coordinator for Smart Dumb Appliance data."""
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
+        # Entry data is read-only, so look it up once for all the settings below
+        entry_data = config_entry.data
+
+        # Resolve naming once per entry so every entity can share it
+        self.device_name = entry_data.get(CONF_DEVICE_NAME, DEFAULT_NAME)
+        self.unique_id_prefix = device_slug(self.device_name)
+
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{config_entry.data.get('name', 'Smart Dumb Appliance')}_coordinator",
+            name=f"{self.device_name}_coordinator",
             update_method=self._async_update_data,
-            update_interval=timedelta(seconds=5),  # Increased from 1 second to 5 seconds for stability
+            update_interval=_IDLE_POLL_INTERVAL,
+            # Refresh immediately on the first request, then at most once per window
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=_REFRESH_COALESCE_SECONDS,
+                immediate=True,
+            ),
+            # Reused snapshots compare equal, so listeners are only notified on changes
+            always_update=False,
         )
         
         self.config_entry = config_entry
-        self._power_sensor = config_entry.data[CONF_POWER_SENSOR]
-        self._cost_sensor = config_entry.data.get(CONF_COST_SENSOR)
-        self._start_watts = config_entry.data.get(CONF_START_WATTS, DEFAULT_START_WATTS)
-        self._stop_watts = config_entry.data.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS)
+
+        self._power_sensor = entry_data[CONF_POWER_SENSOR]
+        self._cost_sensor = entry_data.get(CONF_COST_SENSOR)
+        self._start_watts = entry_data.get(CONF_START_WATTS, DEFAULT_START_WATTS)
+        self._stop_watts = entry_data.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS)
+
+        # Service reminder settings are fixed for the lifetime of the entry
+        self._service_reminder_enabled = entry_data.get(CONF_SERVICE_REMINDER, DEFAULT_SERVICE_REMINDER)
+        self._service_reminder_message = entry_data.get(CONF_SERVICE_REMINDER_MESSAGE, "")
+        self._service_reminder_count = entry_data.get(CONF_SERVICE_REMINDER_COUNT, DEFAULT_SERVICE_REMINDER_COUNT)
+        # Cycles left before the reminder; only changes when a cycle ends
+        self._remaining_cycles = max(0, self._service_reminder_count)
         
         # Handle migration from old debounce to new start/end debounce
-        old_debounce = config_entry.data.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE)
-        self._start_debounce = config_entry.data.get(CONF_START_DEBOUNCE, old_debounce)
-        self._end_debounce = config_entry.data.get(CONF_END_DEBOUNCE, old_debounce)
+        old_debounce = entry_data.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE)
+        self._start_debounce = entry_data.get(CONF_START_DEBOUNCE, old_debounce)
+        self._end_debounce = entry_data.get(CONF_END_DEBOUNCE, old_debounce)
         
         # If we're using the old debounce value, update the config entry
-        if CONF_DEBOUNCE in config_entry.data and CONF_START_DEBOUNCE not in config_entry.data:
+        if CONF_DEBOUNCE in entry_data and CONF_START_DEBOUNCE not in entry_data:
             _LOGGER.info(
                 "Migrating debounce configuration for %s: using %d seconds for both start and end",
-                config_entry.data.get('name', 'Smart Dumb Appliance'),
+                self.device_name,
                 old_debounce
             )
             hass.config_entries.async_update_entry(
                 config_entry,
                 data={
-                    **config_entry.data,
+                    **entry_data,
                     CONF_START_DEBOUNCE: old_debounce,
                     CONF_END_DEBOUNCE: old_debounce,
                 }
@@ -129,35 +243,50 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
         
         # Initialize state tracking
         self._start_time = None
+        self._start_timestamp: float | None = None
         self._end_time = None
         self._use_count = 0
         self._cycle_energy = 0.0
         self._previous_cycle_energy = 0.0
         self._total_energy = 0.0
+        self._total_energy_compensation = 0.0
         self._cycle_cost = 0.0
         self._previous_cycle_cost = 0.0
         self._total_cost = 0.0
+        self._total_cost_compensation = 0.0
         self._was_on = False
         self._last_power = 0.0
         self._last_power_time = None
         self._last_cycle_end_time = None
-        self._last_cycle_duration = None
-        self._total_duration = timedelta(0)
+        self._last_cycle_seconds = None
+        self._total_seconds = 0.0
         self._start_debounce_start = None  # Track when power first went above threshold
         self._end_debounce_start = None    # Track when power first went below threshold
         self.data = None
         self._initialized = False
 
-        # Store the unsubscribe callback
+        # Last raw power state string and its parsed value
+        self._last_raw_state = None
+        self._last_raw_power = 0.0
+
+        # Last parsed cost rate; cleared whenever the cost sensor changes
+        self._cost_cache: float | None = None
+
+        # Last power reading written to the debug log
+        self._last_logged_power: float | None = None
+
+        # Store the unsubscribe callbacks
         self._unsubscribe = None
+        self._unsubscribe_cost = None
+        self._debounce_check_unsub = None
 
-    def _calculate_interval_energy(self, current_power: float, current_time: datetime) -> float:
+    def _calculate_interval_energy(self, current_power: float, current_time: float) -> float:
         """
         Calculate energy used in the interval using trapezoidal integration.
         
         Args:
             current_power: Current power reading in watts
-            current_time: Current timestamp
+            current_time: Current timestamp in epoch seconds
             
         Returns:
             float: Energy used in the interval in kWh
@@ -167,12 +296,12 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
             self._last_power_time = current_time
             return 0.0
             
-        # Calculate time difference in hours
-        time_diff = (current_time - self._last_power_time).total_seconds() / 3600
-        
-        # Use trapezoidal integration: area = (a + b)h/2
-        # Convert watts to kilowatts by dividing by 1000
-        interval_energy = (self._last_power + current_power) * time_diff / (2 * 1000)
+        # Use trapezoidal integration: area = (a + b)h/2, converting W*s to kWh
+        interval_energy = (
+            (self._last_power + current_power)
+            * (current_time - self._last_power_time)
+            * _WATT_SECONDS_TO_KWH_HALF
+        )
         
         # Update last values for next calculation
         self._last_power = current_power
@@ -181,164 +310,272 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
         return interval_energy
 
     def _get_current_cost_rate(self) -> Optional[float]:
-        """Get the current cost per kWh from the cost sensor."""
-        if not self._cost_sensor:
-            return None
+        """
+        Get the current cost per kWh from the cost sensor.
+        
+        Only called when a cost sensor is configured; without one the update
+        skips pricing entirely.
+        """
+        # Tariffs rarely change, so reuse the parsed rate until the cost sensor
+        # reports a change, without looking its state up again
+        if self._cost_cache is not None:
+            return self._cost_cache
             
         cost_state = self.hass.states.get(self._cost_sensor)
         if cost_state is None:
             _LOGGER.warning("Cost sensor %s not found", self._cost_sensor)
             return None
             
-        try:
-            return float(cost_state.state)
-        except (ValueError, TypeError):
+        cost_rate = _parse_float(cost_state.state)
+        if cost_rate is None:
             _LOGGER.warning("Invalid cost sensor state: %s", cost_state.state)
             return None
 
+        self._cost_cache = cost_rate
+        return cost_rate
+
+    def _on_cycle_start(self, current_time: datetime, current_power: float) -> None:
+        """
+        Start a new cycle when the appliance turns on.
+        
+        Args:
+            current_time: Time of the transition
+            current_power: Power reading that confirmed the start, in watts
+        """
+        self._start_time = current_time
+        self._start_timestamp = current_time.timestamp()
+        self._end_time = None
+        self._cycle_energy = 0.0
+        self._cycle_cost = 0.0
+        # Poll faster while running; the new interval applies from the next schedule
+        self.update_interval = _RUNNING_POLL_INTERVAL
+        _LOGGER.info(
+            "Appliance turned on - Current: %.1fW (%.3f kW), Start threshold: %.1fW",
+            current_power,
+            current_power / 1000,
+            self._start_watts
+        )
+
+    def _on_cycle_end(self, current_time: datetime, current_power: float) -> None:
+        """
+        Close the current cycle when the appliance turns off.
+        
+        Args:
+            current_time: Time of the transition
+            current_power: Power reading that confirmed the stop, in watts
+        """
+        self._end_time = current_time
+        self._use_count += 1
+        self.update_interval = _IDLE_POLL_INTERVAL
+        self._remaining_cycles = max(0, self._service_reminder_count - self._use_count)
+        # Durations are kept as plain seconds; timedeltas are only built when displayed
+        current_duration = (
+            current_time.timestamp() - self._start_timestamp
+            if self._start_timestamp is not None
+            else 0.0
+        )
+        
+        # Store previous cycle values when a cycle ends
+        if self._last_cycle_end_time != self._end_time:
+            self._previous_cycle_energy = self._cycle_energy
+            self._previous_cycle_cost = self._cycle_cost
+            self._last_cycle_seconds = current_duration
+            self._total_seconds += current_duration
+            self._last_cycle_end_time = self._end_time
+            _LOGGER.info(
+                "Cycle ended - Previous cycle energy: %.3f kWh, cost: $%.2f, Duration: %.0fs",
+                self._previous_cycle_energy,
+                self._previous_cycle_cost,
+                self._last_cycle_seconds
+            )
+        
+        _LOGGER.info(
+            "Appliance turned off - Duration: %.0fs, Cycle energy: %.3f kWh, Cycle cost: $%.2f",
+            current_duration,
+            self._cycle_energy,
+            self._cycle_cost
+        )
+
+    # Handlers indexed by the transition code (was running << 1 | is running);
+    # steady states need no handler
+    _TRANSITIONS = (
+        None,             # 0b00: idle
+        _on_cycle_start,  # 0b01: turned on
+        _on_cycle_end,    # 0b10: turned off
+        None,             # 0b11: running
+    )
+
     async def _async_update_data(self) -> ApplianceData:
         """Fetch data from the power sensor."""
+        # Only polls and debounce confirmations get here (sensor events compute
+        # directly), so the reading is timestamped now
+        return self._compute_data(self.hass.states.get(self._power_sensor))
+
+    def _compute_data(
+        self, power_state: State | None, current_time: datetime | None = None
+    ) -> ApplianceData:
+        """
+        Update the appliance data from a power sensor state.
+        
+        This never awaits, so it runs synchronously inside the refresh.
+        
+        Args:
+            power_state: The current power sensor state, or None if the sensor is missing
+            current_time: Time of the reading, or None to use the current time
+            
+        Returns:
+            ApplianceData: The updated appliance data
+        """
+        # Bind the entity id used throughout the update
+        power_sensor = self._power_sensor
+
         try:
-            # Get current power reading
-            power_state = self.hass.states.get(self._power_sensor)
             if power_state is None:
-                _LOGGER.warning("Power sensor %s not found", self._power_sensor)
+                _LOGGER.warning("Power sensor %s not found", power_sensor)
                 # Return current data if available to maintain state persistence
                 if self.data:
                     return self.data
                 # Create empty data if no previous state exists
                 return ApplianceData(
-                    last_update=dt_util.utcnow(),
+                    last_update=_utcnow(),
                     power_state=0.0,
-                    power_kw=0.0,
                     is_running=False,
                     start_time=None,
                     end_time=None,
-                    use_count=self._use_count if hasattr(self, '_use_count') else 0,
+                    use_count=self._use_count,
                     cycle_energy=0.0,
-                    previous_cycle_energy=self._previous_cycle_energy if hasattr(self, '_previous_cycle_energy') else 0.0,
-                    total_energy=self._total_energy if hasattr(self, '_total_energy') else 0.0,
+                    previous_cycle_energy=self._previous_cycle_energy,
+                    total_energy=self._total_energy,
                     cycle_cost=0.0,
-                    previous_cycle_cost=self._previous_cycle_cost if hasattr(self, '_previous_cycle_cost') else 0.0,
-                    total_cost=self._total_cost if hasattr(self, '_total_cost') else 0.0,
+                    previous_cycle_cost=self._previous_cycle_cost,
+                    total_cost=self._total_cost,
                     last_power=0.0,
                     last_power_time=None,
-                    cycle_duration=None,
-                    last_cycle_duration=self._last_cycle_duration if hasattr(self, '_last_cycle_duration') else None,
-                    total_duration=self._total_duration if hasattr(self, '_total_duration') else timedelta(0),
+                    last_cycle_seconds=self._last_cycle_seconds,
+                    total_seconds=self._total_seconds,
                     service_status="disabled",
-                    service_reminder_enabled=self.config_entry.data.get(CONF_SERVICE_REMINDER, False),
-                    service_reminder_message=self.config_entry.data.get(CONF_SERVICE_REMINDER_MESSAGE, ""),
-                    service_reminder_count=self.config_entry.data.get(CONF_SERVICE_REMINDER_COUNT, 0),
-                    remaining_cycles=max(0, self.config_entry.data.get(CONF_SERVICE_REMINDER_COUNT, 0) - (self._use_count if hasattr(self, '_use_count') else 0))
+                    service_reminder_enabled=self._service_reminder_enabled,
+                    service_reminder_message=self._service_reminder_message,
+                    service_reminder_count=self._service_reminder_count,
+                    remaining_cycles=self._remaining_cycles
                 )
 
-            try:
-                current_power = float(power_state.state)
-            except (ValueError, TypeError):
-                _LOGGER.warning("Invalid power reading from sensor %s: %s", self._power_sensor, power_state.state)
-                if self.data:
-                    return self.data
-                raise UpdateFailed("Invalid power reading")
-
-            current_time = dt_util.utcnow()
-            power_kw = current_power / 1000  # Convert to kilowatts
+            # State values are always strings; skip the float parse when the reading is unchanged
+            raw_state = power_state.state
+            if raw_state == self._last_raw_state:
+                current_power = self._last_raw_power
+            else:
+                current_power = _parse_float(raw_state)
+                if current_power is None:
+                    _LOGGER.warning("Invalid power reading from sensor %s: %s", power_sensor, raw_state)
+                    if self.data:
+                        return self.data
+                    raise UpdateFailed("Invalid power reading")
+                self._last_raw_state = raw_state
+                self._last_raw_power = current_power
+
+            if current_time is None:
+                current_time = _utcnow()
+            # Interval and debounce arithmetic uses plain epoch seconds, avoiding
+            # timedelta objects for every elapsed-time check
+            now_ts = current_time.timestamp()
+
+            # While idle with an unchanged reading and no start pending, nothing but the
+            # timestamps could change: move the integration point forward so the next
+            # cycle does not price the idle gap, and keep the previous snapshot. This is
+            # intended to be visible: last_update (and the sensors' last_update
+            # attribute) keeps the time of the last reading that changed something
+            # instead of ticking through the idle period
+            previous = self.data
+            if (
+                not self._was_on
+                and self._start_debounce_start is None
+                and previous is not None
+                and previous.power_state == current_power
+            ):
+                self._last_power = current_power
+                self._last_power_time = now_ts
+                return previous
 
             # Calculate energy used in this interval
-            interval_energy = self._calculate_interval_energy(current_power, current_time)
-            
-            # Get current cost rate
-            cost_rate = self._get_current_cost_rate()
+            interval_energy = self._calculate_interval_energy(current_power, now_ts)
             
-            # Calculate interval cost if we have a rate
-            interval_cost = interval_energy * cost_rate if cost_rate is not None else 0.0
-
-            # Log current state
-            _LOGGER.debug(
-                "Current state - Power: %.1fW (%.3f kW), Interval energy: %.3f kWh, Cost rate: %s/kWh",
-                current_power,
-                power_kw,
-                interval_energy,
-                f"${cost_rate:.4f}" if cost_rate is not None else "unknown"
-            )
+            # Hysteresis: a running appliance is compared against the stop threshold,
+            # an idle one against the start threshold, so one compare covers both
+            was_on = self._was_on
+            above_threshold = current_power > (self._stop_watts if was_on else self._start_watts)
 
             # Determine if the appliance is running with separate start/end debounce
-            is_on = self._was_on  # Start with previous state
+            is_on = was_on  # Start with previous state
             
-            # Handle start debounce
-            if current_power > self._start_watts and not self._was_on:
-                if self._start_debounce_start is None:
-                    self._start_debounce_start = current_time
-                elif (current_time - self._start_debounce_start).total_seconds() >= self._start_debounce:
-                    is_on = True
-                    self._start_debounce_start = None
-            else:
+            # Only one debounce can apply: end debounce while running, start debounce otherwise
+            if was_on:
                 self._start_debounce_start = None
-            
-            # Handle end debounce
-            if current_power <= self._stop_watts and self._was_on:
-                if self._end_debounce_start is None:
-                    self._end_debounce_start = current_time
-                elif (current_time - self._end_debounce_start).total_seconds() >= self._end_debounce:
-                    is_on = False
+                
+                # Handle end debounce
+                if not above_threshold:
+                    if self._end_debounce_start is None:
+                        self._end_debounce_start = now_ts
+                        self._async_schedule_debounce_check(self._end_debounce)
+                    elif now_ts - self._end_debounce_start >= self._end_debounce:
+                        is_on = False
+                        self._end_debounce_start = None
+                else:
                     self._end_debounce_start = None
             else:
                 self._end_debounce_start = None
-            
-            # Calculate current duration
-            current_duration = current_time - self._start_time if self._start_time else timedelta(0)
-            
-            # Track state changes
-            if is_on and not self._was_on:
-                self._start_time = current_time
-                self._end_time = None
-                self._cycle_energy = 0.0
-                self._cycle_cost = 0.0
-                _LOGGER.info(
-                    "Appliance turned on - Current: %.1fW (%.3f kW), Start threshold: %.1fW",
-                    current_power,
-                    power_kw,
-                    self._start_watts
-                )
-            elif not is_on and self._was_on:
-                self._end_time = current_time
-                self._use_count += 1
-                
-                # Store previous cycle values when a cycle ends
-                if self._last_cycle_end_time != self._end_time:
-                    self._previous_cycle_energy = self._cycle_energy
-                    self._previous_cycle_cost = self._cycle_cost
-                    self._last_cycle_duration = current_duration
-                    self._total_duration += current_duration
-                    self._last_cycle_end_time = self._end_time
-                    _LOGGER.info(
-                        "Cycle ended - Previous cycle energy: %.3f kWh, cost: $%.2f, Duration: %s",
-                        self._previous_cycle_energy,
-                        self._previous_cycle_cost,
-                        self._last_cycle_duration
-                    )
                 
-                _LOGGER.info(
-                    "Appliance turned off - Duration: %s, Cycle energy: %.3f kWh, Cycle cost: $%.2f",
-                    current_duration,
-                    self._cycle_energy,
-                    self._cycle_cost
-                )
+                # Handle start debounce
+                if above_threshold:
+                    if self._start_debounce_start is None:
+                        self._start_debounce_start = now_ts
+                        self._async_schedule_debounce_check(self._start_debounce)
+                    elif now_ts - self._start_debounce_start >= self._start_debounce:
+                        is_on = True
+                        self._start_debounce_start = None
+                else:
+                    self._start_debounce_start = None
+            
+            # Encode the previous and new running state as one 2-bit code
+            transition_code = (was_on << 1) | is_on
+
+            # Track state changes through the transition table; steady states have no handler
+            transition = self._TRANSITIONS[transition_code]
+            if transition is not None:
+                transition(self, current_time, current_power)
             
             # Update energy and cost tracking
-            if is_on or self._was_on:  # Track energy while running and for the final interval when turning off
+            cost_rate = None
+            if transition_code:  # Track energy while running and for the final interval when turning off
                 self._cycle_energy += interval_energy
-                self._total_energy += interval_energy
-                self._cycle_cost += interval_cost
-                self._total_cost += interval_cost
-            
+                # Lifetime totals grow large, so compensate for the small intervals' lost bits
+                self._total_energy, self._total_energy_compensation = _kahan_add(
+                    self._total_energy, self._total_energy_compensation, interval_energy
+                )
+
+                # Only read the cost sensor when one is configured and there is energy to price
+                if self._cost_sensor:
+                    cost_rate = self._get_current_cost_rate()
+                    if cost_rate is not None:
+                        interval_cost = interval_energy * cost_rate
+                        self._cycle_cost += interval_cost
+                        self._total_cost, self._total_cost_compensation = _kahan_add(
+                            self._total_cost, self._total_cost_compensation, interval_cost
+                        )
+
             self._was_on = is_on
 
+            # Only reached with a start debounce pending (the early return covers the
+            # rest of the idle case): if the debounce has not turned the appliance on,
+            # nothing the snapshot shows changed, since the pending debounce is not
+            # part of it, so keep the previous snapshot
+            if not transition_code and previous is not None and previous.power_state == current_power:
+                return previous
+
             # Create and return the data object
             data = ApplianceData(
                 last_update=current_time,
                 power_state=current_power,
-                power_kw=power_kw,
                 is_running=is_on,
                 start_time=self._start_time,
                 end_time=self._end_time,
@@ -351,54 +588,39 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
                 total_cost=self._total_cost,
                 last_power=self._last_power,
                 last_power_time=self._last_power_time,
-                cycle_duration=current_duration if is_on else None,
-                last_cycle_duration=self._last_cycle_duration,
-                total_duration=self._total_duration,
+                last_cycle_seconds=self._last_cycle_seconds,
+                total_seconds=self._total_seconds,
                 service_status="ok" if is_on else "disabled",
-                service_reminder_enabled=self.config_entry.data.get(CONF_SERVICE_REMINDER, False),
-                service_reminder_message=self.config_entry.data.get(CONF_SERVICE_REMINDER_MESSAGE, ""),
-                service_reminder_count=self.config_entry.data.get(CONF_SERVICE_REMINDER_COUNT, 0),
-                remaining_cycles=max(0, self.config_entry.data.get(CONF_SERVICE_REMINDER_COUNT, 0) - self._use_count)
+                service_reminder_enabled=self._service_reminder_enabled,
+                service_reminder_message=self._service_reminder_message,
+                service_reminder_count=self._service_reminder_count,
+                remaining_cycles=self._remaining_cycles
             )
             
-            # Only log data generation on significant changes or errors
-            if is_on != self._was_on or self._use_count % 10 == 0:  # Log every 10th update or state changes
-                _LOGGER.debug(
-                    "Generated new data - Power: %.1fW (%.3f kW), Running: %s, Cycle energy: %.3f kWh, "
-                    "Previous cycle energy: %.3f kWh, Total energy: %.3f kWh, Cycle cost: $%.2f, "
-                    "Previous cycle cost: $%.2f, Total cost: $%.2f",
-                    current_power,
-                    power_kw,
-                    is_on,
-                    self._cycle_energy,
-                    self._previous_cycle_energy,
-                    self._total_energy,
-                    self._cycle_cost,
-                    self._previous_cycle_cost,
-                    self._total_cost
-                )
+            # The snapshot's repr is only rendered if the debug record is emitted
+            _LOGGER.debug(
+                "Update for %s (interval %.6f kWh, cost rate %s): %s",
+                power_sensor,
+                interval_energy,
+                cost_rate,
+                data,
+            )
             
             return data
 
         except (ValueError, TypeError) as err:
-            _LOGGER.error("Error reading power sensor %s: %s", self._power_sensor, err)
+            _LOGGER.error("Error reading power sensor %s: %s", power_sensor, err)
             raise UpdateFailed(f"Error reading power sensor: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Unexpected error updating data: %s", err)
-            raise UpdateFailed(f"Unexpected error: {err}") from err
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
         if not self._initialized:
-            # Add startup delay only for initial setup
-            await asyncio.sleep(10)  # 10 second delay
+            # Wait for Home Assistant to finish starting so the power sensor exists;
+            # once it is running this continues immediately
+            await self._async_wait_for_started()
             
             # Subscribe to power sensor changes
-            self._unsubscribe = async_track_state_change_event(
-                self.hass,
-                self._power_sensor,
-                self._async_power_sensor_changed
-            )
+            self._async_subscribe()
             
             # Initial data fetch with retry
             retry_count = 0
@@ -406,22 +628,22 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
             retry_delay = 5  # seconds
             
             while retry_count < max_retries:
-                try:
-                    await self.async_request_refresh()
-                    if self.data is not None:
-                        _LOGGER.info("Successfully initialized coordinator for %s", self._power_sensor)
-                        self._initialized = True
-                        return
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Attempt %d/%d failed to initialize coordinator: %s",
-                        retry_count + 1,
-                        max_retries,
-                        err
-                    )
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        await asyncio.sleep(retry_delay)
+                # async_refresh records failures instead of raising, so check the result
+                await self.async_refresh()
+                if self.last_update_success and self.data is not None:
+                    _LOGGER.info("Successfully initialized coordinator for %s", self._power_sensor)
+                    self._initialized = True
+                    return
+
+                retry_count += 1
+                _LOGGER.warning(
+                    "Attempt %d/%d failed to initialize coordinator for %s",
+                    retry_count,
+                    max_retries,
+                    self._power_sensor
+                )
+                if retry_count < max_retries:
+                    await asyncio.sleep(retry_delay)
             
             _LOGGER.error(
                 "Failed to initialize coordinator for %s after %d attempts",
@@ -431,11 +653,73 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
         else:
             # If already initialized, just ensure we're subscribed to updates
             if not self._unsubscribe:
-                self._unsubscribe = async_track_state_change_event(
-                    self.hass,
-                    self._power_sensor,
-                    self._async_power_sensor_changed
-                )
+                self._async_subscribe()
+
+    async def _async_wait_for_started(self) -> None:
+        """Wait until Home Assistant has finished starting."""
+        started = self.hass.loop.create_future()
+
+        @callback
+        def _async_started(_hass: HomeAssistant) -> None:
+            """Resolve the wait once Home Assistant has started."""
+            if not started.done():
+                started.set_result(None)
+
+        cancel = async_at_started(self.hass, _async_started)
+        try:
+            await started
+        finally:
+            # Drop the startup listener if setup is cancelled while waiting
+            cancel()
+
+    @callback
+    def _async_subscribe(self) -> None:
+        """Subscribe to state change events of the power and cost sensors."""
+        self._unsubscribe = async_track_state_change_event(
+            self.hass,
+            [self._power_sensor],
+            self._async_power_sensor_changed
+        )
+        if self._cost_sensor:
+            # A rate cached before subscribing may already be stale
+            self._cost_cache = None
+            self._unsubscribe_cost = async_track_state_change_event(
+                self.hass,
+                [self._cost_sensor],
+                self._async_cost_sensor_changed
+            )
+
+    @callback
+    def _async_cost_sensor_changed(self, _event: Event[EventStateChangedData]) -> None:
+        """Drop the cached cost rate so the next priced interval reads the new one."""
+        self._cost_cache = None
+
+    @callback
+    def _async_schedule_debounce_check(self, delay: float) -> None:
+        """
+        Schedule a refresh for when a pending debounce can be confirmed.
+        
+        Power sensors often stop reporting once a reading is steady, so without
+        this the confirmation would wait for the next fallback poll.
+        
+        Args:
+            delay: Debounce time in seconds
+        """
+        if self._debounce_check_unsub:
+            self._debounce_check_unsub()
+        self._debounce_check_unsub = async_call_later(
+            self.hass, delay + _DEBOUNCE_MARGIN_SECONDS, self._async_debounce_check
+        )
+
+    @callback
+    def _async_debounce_check(self, _now: datetime) -> None:
+        """Refresh once a debounce deadline has passed."""
+        self._debounce_check_unsub = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            f"{self.name} debounce check",
+        )
 
     async def async_shutdown(self) -> None:
         """Clean up resources."""
@@ -449,25 +733,40 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
                 # Ignore errors if the listener was already removed
                 _LOGGER.debug("Listener already removed for %s", self._power_sensor)
             self._unsubscribe = None
+        if self._unsubscribe_cost:
+            self._unsubscribe_cost()
+            self._unsubscribe_cost = None
+
+        # Cancel any pending debounce confirmation
+        if self._debounce_check_unsub:
+            self._debounce_check_unsub()
+            self._debounce_check_unsub = None
         
         # Clear all state
         self._start_time = None
+        self._start_timestamp = None
         self._end_time = None
         self._use_count = 0
+        self._remaining_cycles = max(0, self._service_reminder_count)
         self._cycle_energy = 0.0
         self._previous_cycle_energy = 0.0
         self._total_energy = 0.0
+        self._total_energy_compensation = 0.0
         self._cycle_cost = 0.0
         self._previous_cycle_cost = 0.0
         self._total_cost = 0.0
+        self._total_cost_compensation = 0.0
         self._was_on = False
         self._last_power = 0.0
         self._last_power_time = None
         self._last_cycle_end_time = None
-        self._last_cycle_duration = None
-        self._total_duration = timedelta(0)
+        self._last_cycle_seconds = None
+        self._total_seconds = 0.0
         self._start_debounce_start = None
         self._end_debounce_start = None
+        self._last_raw_state = None
+        self._last_raw_power = 0.0
+        self._cost_cache = None
         self.data = None
         self._initialized = False
         
@@ -475,69 +774,46 @@ class SmartDumbApplianceCoordinator(DataUpdateCoordinator):
         await super().async_shutdown()
 
     @callback
-    def _async_power_sensor_changed(self, event) -> None:
+    def _async_power_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
         """Handle power sensor state changes."""
-        new_state = event.data.get("new_state")
+        new_state = event.data["new_state"]
         if new_state is None:
             _LOGGER.debug("Power sensor %s state is None, skipping update", self._power_sensor)
             return
         
-        # Only log significant changes to reduce log noise
-        try:
-            new_power = float(new_state.state)
-            if hasattr(self, '_last_logged_power'):
-                power_diff = abs(new_power - self._last_logged_power)
-                if power_diff > 10:  # Only log if power changed by more than 10W
-                    _LOGGER.debug(
-                        "Power sensor %s changed: %.1fW -> %.1fW",
-                        self._power_sensor,
-                        self._last_logged_power,
-                        new_power
-                    )
+        # Only log significant changes to reduce log noise; the reading is parsed
+        # here purely for logging, so skip it entirely unless debug is enabled
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            try:
+                new_power = float(new_state.state)
+                if self._last_logged_power is not None:
+                    power_diff = abs(new_power - self._last_logged_power)
+                    if power_diff > 10:  # Only log if power changed by more than 10W
+                        _LOGGER.debug(
+                            "Power sensor %s changed: %.1fW -> %.1fW",
+                            self._power_sensor,
+                            self._last_logged_power,
+                            new_power
+                        )
+                        self._last_logged_power = new_power
+                else:
                     self._last_logged_power = new_power
-            else:
-                self._last_logged_power = new_power
-        except (ValueError, TypeError):
-            _LOGGER.debug("Power sensor %s has invalid state: %s", self._power_sensor, new_state.state)
+            except (ValueError, TypeError):
+                _LOGGER.debug("Power sensor %s has invalid state: %s", self._power_sensor, new_state.state)
         
-        # Schedule an update
-        self.hass.async_create_task(self.async_refresh())
-
-    async def _async_handle_power_change(self) -> None:
-        """Handle power sensor changes asynchronously."""
+        # The update is pure computation, so run it right here on the state the
+        # event carries, timestamped when the sensor reported it
         try:
-            data = await self._async_update_data()
-            self.data = data
-            _LOGGER.debug("Updated coordinator data: %s", data)
-            self.async_set_updated_data(data)
-        except Exception as err:
-            _LOGGER.error("Error updating data: %s", err)
-            self.last_update_success = False
-            self.async_update_listeners()
-
-    async def async_update_data(self) -> ApplianceData:
-        """
-        Fetch data from the power sensor.
-        
-        This is the update method for the coordinator. It will be called
-        periodically to update the sensor data.
-        
-        Returns:
-            ApplianceData: The updated appliance data
-        """
-        return await self._async_update_data()
-
-    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
-        """Listen for data updates."""
-        return super().async_add_listener(update_callback)
-
-    def async_remove_listener(self, update_callback: Callable[[], None]) -> None:
-        """Remove listener from data updates."""
-        super().async_remove_listener(update_callback)
-
-    def async_set_updated_data(self, data: ApplianceData) -> None:
-        """Set updated data and notify listeners."""
-        self.data = data
-        self.async_update_listeners()
+            data = self._compute_data(new_state, new_state.last_updated)
+        except UpdateFailed:
+            # Let a regular refresh record the failure on the coordinator
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_request_refresh(),
+                f"{self.name} refresh after failure",
+            )
+            return
 
-    # Removed duplicate async_shutdown method to prevent conflicts 
\ No newline at end of file
+        # A reused snapshot means nothing changed, so there is nothing to publish
+        if data is not self.data:
+            self.async_set_updated_data(data)
@@ -4,8 +4,9 @@ Sensor platform for Smart Dumb Appliance.
 This module creates sensors that monitor an appliance's energy usage and status.
 It includes:
 - Main energy sensor (kWh) with detailed attributes
-- Binary sensor for on/off state
 - Service status sensor for maintenance tracking
+
+The on/off state lives in the binary_sensor platform.
 """
 
 from __future__ import annotations
@@ -16,10 +17,10 @@ from typing import Any
 from difflib import SequenceMatcher
 import base64
 from io import BytesIO
+from types import MappingProxyType
 from PIL import Image, ImageDraw
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
-from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -49,10 +50,9 @@ from .const import (
     ATTR_LAST_SERVICE,
     ATTR_NEXT_SERVICE,
     ATTR_SERVICE_MESSAGE,
-    CONF_DEVICE_NAME,
     DOMAIN,
 )
-from .coordinator import SmartDumbApplianceCoordinator
+from .coordinator import ApplianceData, SmartDumbApplianceCoordinator
 
 # Set up logging for this module
 _LOGGER = logging.getLogger(__name__)
@@ -246,7 +246,8 @@ def create_colored_icon(icon_name: str, color: str) -> str:
         buffered = BytesIO()
         image.save(buffered, format="PNG")
         return f"data:image/png;base64,{base64.b64encode(buffered.getvalue()).decode()}"
-    except Exception as e:
+    except (ValueError, OSError) as e:
+        # Invalid colour strings or PNG encoding failures
         _LOGGER.error("Error creating colored icon: %s", e)
         return None
 
@@ -296,60 +297,59 @@ async def async_setup_entry(
         SmartDumbAppliancePowerSensor(coordinator, config_entry),
         SmartDumbApplianceDurationSensor(coordinator, config_entry),
         SmartDumbApplianceEnergySensor(coordinator, config_entry),
+        SmartDumbAppliancePreviousCycleEnergySensor(coordinator, config_entry),
+        SmartDumbApplianceTotalEnergySensor(coordinator, config_entry),
         SmartDumbApplianceCostSensor(coordinator, config_entry),
     ]
     
     async_add_entities(sensors)
 
-class SmartDumbApplianceBinarySensor(BinarySensorEntity):
-    """Binary sensor representing the cycle state of a smart dumb appliance."""
+class SmartDumbApplianceCoordinatorSensor(SensorEntity):
+    """
+    Base class for the sensors backed by the appliance coordinator.
+    
+    Handles the shared naming, listener wiring and state writes. Subclasses
+    describe what they show through two hooks:
+    - _written_fields: the fields behind the state, so unchanged updates skip
+      the write (None always writes)
+    - _update_attributes: refresh the attributes before a write
+    """
+
+    # Updates are pushed by the coordinator, so Home Assistant must not poll
+    _attr_should_poll = False
 
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
+        name: str,
+        key: str,
     ) -> None:
-        """Initialize the binary sensor."""
+        """
+        Initialize the sensor.
+        
+        Args:
+            coordinator: The update coordinator for managing updates
+            config_entry: The configuration entry containing all settings
+            name: Sensor name, shown after the device name
+            key: Suffix of the sensor's unique id
+        """
         self.coordinator = coordinator
         self.config_entry = config_entry
-        self._attr_name = f"{config_entry.data.get('name', 'Smart Dumb Appliance')} Cycle State"
-        self._attr_unique_id = f"{config_entry.entry_id}_binary_sensor"
-        self._attr_device_class = "power"
-        self._attr_icon = "mdi:power"
-        self._attr_extra_state_attributes = {
-            "current_power": 0.0,
-            "start_time": None,
-            "end_time": None,
-            "cycle_duration": "0:00:00",
-            "cycle_energy": 0.0,
-            "cycle_cost": 0.0,
-            "last_update": None,
-        }
+        
+        # Naming is resolved once per entry by the coordinator
+        self._attr_name = f"{coordinator.device_name} {name}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the appliance is running."""
-        if self.coordinator.data is None:
-            return False
-        return self.coordinator.data.is_running
+        # Fields behind the last state write; None until the first write
+        self._last_written: Any = None
 
-    @property
-    def extra_state_attributes(self):
-        """Return entity specific state attributes."""
-        if self.coordinator.data is None:
-            return self._attr_extra_state_attributes
+    def _written_fields(self, data: ApplianceData) -> Any:
+        """Return the fields behind the state, or None to write on every update."""
+        return None
 
-        data = self.coordinator.data
-        self._attr_extra_state_attributes.update({
-            "current_power": data.power_state,
-            "start_time": data.formatted_start_time,
-            "end_time": data.formatted_end_time,
-            "cycle_duration": data.formatted_cycle_duration,
-            "cycle_energy": data.cycle_energy,
-            "cycle_cost": data.cycle_cost,
-            "last_update": data.formatted_last_update,
-        })
-        return self._attr_extra_state_attributes
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Refresh the attributes ahead of a state write."""
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -366,27 +366,31 @@ class SmartDumbApplianceBinarySensor(BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        data = self.coordinator.data
+        if data is not None:
+            # Skip the write when none of the fields this sensor shows changed
+            written = self._written_fields(data)
+            if written is not None:
+                if written == self._last_written:
+                    return
+                self._last_written = written
+
+            # Build the attributes once per write instead of on every read
+            self._update_attributes(data)
         self.async_write_ha_state()
 
-class SmartDumbApplianceServiceSensor(SensorEntity):
+class SmartDumbApplianceServiceSensor(SmartDumbApplianceCoordinatorSensor):
     """Sensor representing the service status of a smart dumb appliance."""
 
+    _attr_icon = "mdi:wrench"
+
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the service status sensor."""
-        self.coordinator = coordinator
-        self.config_entry = config_entry
-        
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
-        
-        # Set up entity attributes
-        self._attr_name = f"{device_name} Service Status"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_service_status"
-        self._attr_icon = "mdi:wrench"
+        super().__init__(coordinator, config_entry, "Service Status", "service_status")
         self._attr_extra_state_attributes = {
             "cycle_count": 0,
             "service_reminder_enabled": False,
@@ -404,14 +408,9 @@ class SmartDumbApplianceServiceSensor(SensorEntity):
             return "ok"
         return self.coordinator.data.service_status
 
-    @property
-    def extra_state_attributes(self):
-        """Return entity specific state attributes."""
-        if self.coordinator.data is None:
-            return self._attr_extra_state_attributes
-
-        data = self.coordinator.data
-        self._attr_extra_state_attributes.update({
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Refresh the service attributes."""
+        self._attr_extra_state_attributes = {
             "cycle_count": data.use_count,
             "service_reminder_enabled": data.service_reminder_enabled,
             "service_reminder_message": data.service_reminder_message,
@@ -419,48 +418,23 @@ class SmartDumbApplianceServiceSensor(SensorEntity):
             "remaining_cycles": data.remaining_cycles,
             "current_running_state": data.is_running,
             "last_update": data.formatted_last_update,
-        })
-        return self._attr_extra_state_attributes
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Handle removal from Home Assistant."""
-        _LOGGER.debug("Removing sensor: %s", self.entity_id)
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        }
 
-class SmartDumbAppliancePowerSensor(SensorEntity):
+class SmartDumbAppliancePowerSensor(SmartDumbApplianceCoordinatorSensor):
     """Sensor representing the current power usage of a smart dumb appliance."""
 
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:lightning-bolt"
+
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the current power sensor."""
-        self.coordinator = coordinator
-        self.config_entry = config_entry
-        
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
-        
-        # Set up entity attributes
-        self._attr_name = f"{device_name} Current Power"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_current_power"
-        self._attr_device_class = SensorDeviceClass.POWER
-        self._attr_native_unit_of_measurement = UnitOfPower.WATT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:lightning-bolt"
+        super().__init__(coordinator, config_entry, "Current Power", "current_power")
         self._attr_extra_state_attributes = {
             "start_threshold": config_entry.data.get(CONF_START_WATTS, DEFAULT_START_WATTS),
             "stop_threshold": config_entry.data.get(CONF_STOP_WATTS, DEFAULT_STOP_WATTS),
@@ -476,57 +450,42 @@ class SmartDumbAppliancePowerSensor(SensorEntity):
             return 0.0
         return self.coordinator.data.power_state
 
-    @property
-    def extra_state_attributes(self):
-        """Return entity specific state attributes."""
-        if self.coordinator.data is None:
-            return self._attr_extra_state_attributes
-
-        data = self.coordinator.data
-        self._attr_extra_state_attributes.update({
+    def _written_fields(self, data: ApplianceData) -> tuple[float, bool]:
+        """
+        Return the reading and running state this sensor shows.
+        
+        last_update is left out on purpose: it changes on every update, so keying
+        on it would write the state on every tick. The attribute therefore holds
+        the time of the last reading that changed this sensor.
+        """
+        return data.power_state, data.is_running
+
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Refresh the running state and update time, keeping the static settings."""
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
             "running_state": data.is_running,
             "last_update": data.formatted_last_update,
-        })
-        return self._attr_extra_state_attributes
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Handle removal from Home Assistant."""
-        _LOGGER.debug("Removing sensor: %s", self.entity_id)
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        }
 
-class SmartDumbApplianceDurationSensor(SensorEntity):
+class SmartDumbApplianceDurationSensor(SmartDumbApplianceCoordinatorSensor):
     """Sensor for tracking appliance cycle duration."""
 
+    _attr_icon = "mdi:timer"
+
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the duration sensor."""
-        super().__init__()
-        self.coordinator = coordinator
-        
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
-        
-        # Set up entity attributes
-        self._attr_name = f"{device_name} Cycle Duration"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_cycle_duration"
-        self._attr_device_class = None
-        self._attr_native_unit_of_measurement = None
-        self._attr_icon = "mdi:timer"
+        super().__init__(coordinator, config_entry, "Cycle Duration", "cycle_duration")
+        self._attr_extra_state_attributes = {
+            "current_cycle_duration": None,
+            "previous_cycle_duration": "0:00:00",
+            "total_duration": "0:00:00",
+            "last_update": None,
+        }
 
     @property
     def native_value(self) -> timedelta | None:
@@ -535,70 +494,35 @@ class SmartDumbApplianceDurationSensor(SensorEntity):
             return None
         return self.coordinator.data.cycle_duration
 
-    @property
-    def extra_state_attributes(self):
-        """Return additional attributes."""
-        if not self.coordinator.data:
-            return {
-                "current_cycle_duration": None,
-                "previous_cycle_duration": "0:00:00",
-                "total_duration": "0:00:00",
-                "last_update": None,
-            }
-            
-        data = self.coordinator.data
-        return {
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Refresh the duration attributes."""
+        self._attr_extra_state_attributes = {
             "current_cycle_duration": data.formatted_cycle_duration,
             "previous_cycle_duration": data.formatted_last_cycle_duration,
             "total_duration": data.formatted_total_duration,
             "last_update": data.formatted_last_update,
         }
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Handle removal from Home Assistant."""
-        _LOGGER.debug("Removing sensor: %s", self.entity_id)
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
-class SmartDumbApplianceEnergySensor(SensorEntity):
+class SmartDumbApplianceEnergySensor(SmartDumbApplianceCoordinatorSensor):
     """Sensor representing the cycle energy usage of a smart dumb appliance."""
 
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:lightning-bolt"
+
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the cycle energy sensor."""
-        self.coordinator = coordinator
-        self.config_entry = config_entry
-        
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
-        
-        # Set up entity attributes
-        self._attr_name = f"{device_name} Cycle Energy"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_cycle_energy"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_icon = "mdi:lightning-bolt"
-        self._attr_extra_state_attributes = {
-            "current_cycle_energy": 0.0,
-            "previous_cycle_energy": 0.0,
-            "total_energy": 0.0,
-            "last_update": None,
-        }
+        super().__init__(coordinator, config_entry, "Cycle Energy", "cycle_energy")
+        # Only static details live in the attributes; the previous cycle and total
+        # energy have their own sensors so the recorder stores them as plain states
+        self._attr_extra_state_attributes = MappingProxyType({
+            "power_sensor": config_entry.data[CONF_POWER_SENSOR],
+        })
 
     @property
     def native_value(self) -> float:
@@ -607,60 +531,94 @@ class SmartDumbApplianceEnergySensor(SensorEntity):
             return 0.0
         return self.coordinator.data.cycle_energy
 
+    def _written_fields(self, data: ApplianceData) -> float:
+        """Return the cycle energy this sensor shows."""
+        return data.cycle_energy
+
+class SmartDumbAppliancePreviousCycleEnergySensor(SmartDumbApplianceCoordinatorSensor):
+    """Sensor representing the energy used by the previous cycle of a smart dumb appliance."""
+
+    # Each completed cycle is its own meter reading: TOTAL with last_reset at the
+    # cycle's start lets long-term statistics sum the energy of every cycle
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:lightning-bolt-outline"
+
+    def __init__(
+        self,
+        coordinator: SmartDumbApplianceCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the previous cycle energy sensor."""
+        super().__init__(
+            coordinator, config_entry, "Previous Cycle Energy", "previous_cycle_energy"
+        )
+
     @property
-    def extra_state_attributes(self):
-        """Return entity specific state attributes."""
+    def native_value(self) -> float:
+        """Return the energy used by the previous cycle."""
         if self.coordinator.data is None:
-            return self._attr_extra_state_attributes
+            return 0.0
+        return self.coordinator.data.previous_cycle_energy
 
-        data = self.coordinator.data
-        self._attr_extra_state_attributes.update({
-            "current_cycle_energy": data.cycle_energy,
-            "previous_cycle_energy": data.previous_cycle_energy,
-            "total_energy": data.total_energy,
-            "last_update": data.formatted_last_update,
-        })
-        return self._attr_extra_state_attributes
+    def _written_fields(self, data: ApplianceData) -> tuple[float, int]:
+        """
+        Return the previous cycle energy and the completed cycle count.
+        
+        Both only change when a cycle ends. The count makes back-to-back cycles
+        that used the same energy still register as a new reading.
+        """
+        return data.previous_cycle_energy, data.use_count
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Mark the new reading as a reset at the start of the cycle it measures."""
+        if data.start_time is not None:
+            self._attr_last_reset = data.start_time
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Handle removal from Home Assistant."""
-        _LOGGER.debug("Removing sensor: %s", self.entity_id)
-        await super().async_will_remove_from_hass()
+class SmartDumbApplianceTotalEnergySensor(SmartDumbApplianceCoordinatorSensor):
+    """Sensor representing the total energy usage of a smart dumb appliance."""
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:lightning-bolt-circle"
+
+    def __init__(
+        self,
+        coordinator: SmartDumbApplianceCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the total energy sensor."""
+        super().__init__(coordinator, config_entry, "Total Energy", "total_energy")
 
-class SmartDumbApplianceCostSensor(SensorEntity):
+    @property
+    def native_value(self) -> float:
+        """Return the total energy usage."""
+        if self.coordinator.data is None:
+            return 0.0
+        return self.coordinator.data.total_energy
+
+    def _written_fields(self, data: ApplianceData) -> float:
+        """Return the total energy this sensor shows."""
+        return data.total_energy
+
+class SmartDumbApplianceCostSensor(SmartDumbApplianceCoordinatorSensor):
     """Sensor representing the cycle cost of a smart dumb appliance."""
 
+    # Fixed entity descriptors shared by every instance
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "USD"
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:currency-usd"
+
     def __init__(
         self,
         coordinator: SmartDumbApplianceCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the cycle cost sensor."""
-        self.coordinator = coordinator
-        self.config_entry = config_entry
-        
-        # Get device name from config
-        device_name = config_entry.data.get(CONF_DEVICE_NAME, 'Smart Dumb Appliance')
-        
-        # Set up entity attributes
-        self._attr_name = f"{device_name} Cycle Cost"
-        self._attr_unique_id = f"{device_name.lower().replace(' ', '_')}_cycle_cost"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_native_unit_of_measurement = "USD"
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:currency-usd"
+        super().__init__(coordinator, config_entry, "Cycle Cost", "cycle_cost")
         self._attr_extra_state_attributes = {
             "current_cycle_cost": 0.0,
             "previous_cycle_cost": 0.0,
@@ -675,34 +633,11 @@ class SmartDumbApplianceCostSensor(SensorEntity):
             return 0.0
         return self.coordinator.data.cycle_cost
 
-    @property
-    def extra_state_attributes(self):
-        """Return entity specific state attributes."""
-        if self.coordinator.data is None:
-            return self._attr_extra_state_attributes
-
-        data = self.coordinator.data
-        self._attr_extra_state_attributes.update({
+    def _update_attributes(self, data: ApplianceData) -> None:
+        """Refresh the cost attributes."""
+        self._attr_extra_state_attributes = {
             "current_cycle_cost": data.cycle_cost,
             "previous_cycle_cost": data.previous_cycle_cost,
             "total_cost": data.total_cost,
             "last_update": data.formatted_last_update,
-        })
-        return self._attr_extra_state_attributes
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Handle removal from Home Assistant."""
-        _LOGGER.debug("Removing sensor: %s", self.entity_id)
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state() 
\ No newline at end of file
+        }